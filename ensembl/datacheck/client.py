@@ -97,54 +97,54 @@ class DatacheckClient(RestClient):
       print_results : set to True to print detailed results
       print_input : set to True to print input for job
     """
-        logging.info("Job %s - %s" % (job['id'], job['status']))
+        logging.info("Job %s - %s", job['id'], job['status'])
         if print_input is True:
             self.print_inputs(job['input'])
         if job['status'] == 'complete':
             if print_results is True:
-                logging.info("Submission status: " + str(job['status']))
-                logging.info("Database passed: " + str(job['output']['passed_total']))
-                logging.info("Database failed: " + str(job['output']['failed_total']))
-                logging.info("Output directory: " + str(job['output']['output_dir']))
+                logging.info("Submission status: %s", job['status'])
+                logging.info("Database passed: %s", job['output']['passed_total'])
+                logging.info("Database failed: %s", job['output']['failed_total'])
+                logging.info("Output directory: %s", job['output']['output_dir'])
                 logging.info("Per database results: ")
                 logging.info(json.dumps(job['output']['databases'], indent=2))
         elif job['status'] == 'incomplete':
             if print_results is True:
-                logging.info("Submission status: " + str(job['status']))
+                logging.info("Submission status: %s", job['status'])
         elif job['status'] == 'failed':
-            logging.info("Submission status: " + str(job['status']))
+            logging.info("Submission status: %s", job['status'])
             # failures = self.retrieve_job_failure(job['id'])
-            # logging.info("Error: " + str(failures))
+            # logging.info("Error: %s", failures)
         else:
             raise ValueError("Unknown status {}".format(job['status']))
 
     def print_inputs(self, i):
         """Utility to render a job input dict to logging"""
-        logging.info("Registry file: " + i['registry_file'])
+        logging.info("Registry file: %s", i['registry_file'])
         if 'dbname' in i:
             for dbname in i['dbname']:
-                logging.info("Database name: " + dbname)
+                logging.info("Database name: %s", dbname)
         if 'species' in i:
             for species in i['species']:
-                logging.info("Species name: " + species)
+                logging.info("Species name: %s", species)
         if 'division' in i:
             for division in i['division']:
-                logging.info("Division name: " + division)
+                logging.info("Division name: %s", division)
         if 'db_type' in i:
-            logging.info("Database type: " + i['db_type'])
+            logging.info("Database type: %s", i['db_type'])
         if 'datacheck_names' in i:
             for name in i['datacheck_names']:
-                logging.info("Datacheck: " + name)
+                logging.info("Datacheck: %s", name)
         if 'datacheck_groups' in i:
             for group in i['datacheck_groups']:
-                logging.info("Datacheck group: " + group)
+                logging.info("Datacheck group: %s", group)
         if 'datacheck_types' in i:
             for datacheck_type in i['datacheck_types']:
-                logging.info("Datacheck type: " + datacheck_type)
+                logging.info("Datacheck type: %s", datacheck_type)
         if 'email' in i:
-            logging.info("Email: " + i['email'])
+            logging.info("Email: %s", i['email'])
         if 'tag' in i:
-            logging.info("Tag: " + i['tag'])
+            logging.info("Tag: %s", i['tag'])
 
 
 if __name__ == '__main__':
@@ -182,7 +182,7 @@ if __name__ == '__main__':
         job_id = client.submit_job(args.server_url, args.dbname, args.species, args.division, args.db_type,
                                    args.datacheck_names, args.datacheck_groups, args.datacheck_types,
                                    args.email, args.tag)
-        logging.info('Job submitted with ID ' + str(job_id))
+        logging.info('Job submitted with ID %s', job_id)
 
     elif args.action == 'retrieve':
         job = client.retrieve_job(args.job_id)
@@ -63,32 +63,32 @@ class GIFTsClient(RestClient):
       print_results : set to True to print detailed results
       print_input : set to True to print input for job
     """
-    logging.info("Job %s - %s" % (job['id'], job['status']))
+    logging.info("Job %s - %s", job['id'], job['status'])
     if print_input == True:
       self.print_inputs(job['input'])
     if job['status'] == 'complete':
       if print_results == True:
-        logging.info("Submission status: " + str(job['status']))
+        logging.info("Submission status: %s", job['status'])
     elif job['status'] == 'incomplete':
       if print_results == True:
-        logging.info("Submission status: " + str(job['status']))
+        logging.info("Submission status: %s", job['status'])
     elif job['status'] == 'failed':
-      logging.info("Submission status: " + str(job['status']))
+      logging.info("Submission status: %s", job['status'])
       #failures = self.retrieve_job_failure(job['id'])
-      #logging.info("Error: " + str(failures))
+      #logging.info("Error: %s", failures)
     else:
       raise ValueError("Unknown status {}".format(job['status']))
 
   def print_inputs(self, i):
     """Utility to render a job input dict to logging"""
     if 'ensembl_release' in i:
-      logging.info("Ensembl Release: " + i['ensembl_release'])
+      logging.info("Ensembl Release: %s", i['ensembl_release'])
     if 'environment' in i:
-      logging.info("Environment: " + i['environment'])
+      logging.info("Environment: %s", i['environment'])
     if 'email' in i:
-      logging.info("Email: " + i['email'])
+      logging.info("Email: %s", i['email'])
     if 'tag' in i:
-      logging.info("Tag: " + i['tag'])
+      logging.info("Tag: %s", i['tag'])
 
 
 if __name__ == '__main__':
@@ -119,7 +119,7 @@ if __name__ == '__main__':
 
   if args.action == 'submit':
     job_id = client.submit_job(args.ensembl_release, args.environment, args.email, args.tag)
-    logging.info('Job submitted with ID ' + str(job_id))
+    logging.info('Job submitted with ID %s', job_id)
 
   elif args.action == 'retrieve':
     job = client.retrieve_job(args.job_id)
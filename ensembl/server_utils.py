@@ -67,12 +67,12 @@ def get_status(host=None, dir_name=None):
     status.update(run_process('grep -c "^processor" /proc/cpuinfo', process_ncores, host))
     return status
 
-up_pattern = re.compile('.* load average: ([0-9.]+), ([0-9.]+), ([0-9.]+)')
+up_pattern = re.compile(r' load average: ([0-9.]+), ([0-9.]+), ([0-9.]+)')
 
 
 def process_uptime(status, line):
     """Internal method to parse output of uptime and add to status hash"""
-    m = up_pattern.match(line)
+    m = up_pattern.search(line)
     if m:
         status['load_1m'] = float(m.group(1))
         status['load_5m'] = float(m.group(2))
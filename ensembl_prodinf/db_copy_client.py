@@ -66,21 +66,21 @@ class DbCopyClient(RestClient):
           print_results : set to True to show results
           print_input : set to True to show input
         """
-        logging.info("Job %s (%s) to (%s) - %s" % (job['id'], job['input']['source_db_uri'], job['input']['target_db_uri'], job['status']))
+        logging.info("Job %s (%s) to (%s) - %s", job['id'], job['input']['source_db_uri'], job['input']['target_db_uri'], job['status'])
         if print_input == True:
             self.print_inputs(job['input'])
         if job['status'] == 'complete':
             if print_results == True:
-                logging.info("Copy result: " + str(job['status']))
-                logging.info("Copy took: " +str(job['output']['runtime']))
+                logging.info("Copy result: %s", job['status'])
+                logging.info("Copy took: %s", job['output']['runtime'])
         elif job['status'] == 'running':
             if print_results == True:
-                logging.info("HC result: " + str(job['status']))
-                logging.info(str(job['progress']['complete'])+"/"+str(job['progress']['total'])+" task complete")
-                logging.info("Status: "+str(job['progress']['message']))
+                logging.info("HC result: %s", job['status'])
+                logging.info("%s/%s task complete", job['progress']['complete'], job['progress']['total'])
+                logging.info("Status: %s", job['progress']['message'])
         elif job['status'] == 'failed':
             failure_msg = self.retrieve_job_failure(job['id'])
-            logging.info("Job failed with error: "+ str(failure_msg['msg']))
+            logging.info("Job failed with error: %s", failure_msg['msg'])
 
     def print_inputs(self, i):
 
@@ -90,22 +90,22 @@ class DbCopyClient(RestClient):
           i : job input
         """
 
-        logging.info("Source URI: " + i['source_db_uri'])
-        logging.info("Target URI: " + i['target_db_uri'])
+        logging.info("Source URI: %s", i['source_db_uri'])
+        logging.info("Target URI: %s", i['target_db_uri'])
         if 'only_tables' in i:
-            logging.info("List of tables to copy: " + i['only_tables'])
+            logging.info("List of tables to copy: %s", i['only_tables'])
         if 'skip_tables' in i:
-            logging.info("List of tables to skip: " + i['skip_tables'])
+            logging.info("List of tables to skip: %s", i['skip_tables'])
         if 'update' in i:
-            logging.info("Incremental database update using rsync checksum set to: " + i['update'])
+            logging.info("Incremental database update using rsync checksum set to: %s", i['update'])
         if 'drop' in i:
-            logging.info("Drop database on Target server before copy set to: " + i['drop'])
+            logging.info("Drop database on Target server before copy set to: %s", i['drop'])
         if 'convert_innodb' in i:
-            logging.info("Convert InnoDB tables to MyISAM set to: " + i['convert_innodb'])
+            logging.info("Convert InnoDB tables to MyISAM set to: %s", i['convert_innodb'])
         if 'skip_optimize' in i:
-            logging.info("Skip optimize set to: " + i['skip_optimize'])
+            logging.info("Skip optimize set to: %s", i['skip_optimize'])
         if 'email' in i:
-            logging.info("email: " + i['email'])
+            logging.info("email: %s", i['email'])
 
 if __name__ == '__main__':
 
@@ -143,15 +143,15 @@ if __name__ == '__main__':
     if args.action == 'submit':
 
         if args.input_file == None:
-            logging.info("Submitting " + args.source_db_uri + "->" + args.target_db_uri)
+            logging.info("Submitting %s->%s", args.source_db_uri, args.target_db_uri)
             job_id = client.submit_job(args.source_db_uri, args.target_db_uri, args.only_tables, args.skip_tables, args.update, args.drop, args.convert_innodb, args.skip_optimize, args.email)
-            logging.info('Job submitted with ID '+str(job_id))
+            logging.info('Job submitted with ID %s', job_id)
         else:
             for line in args.input_file:
                 uris = line.split()
-                logging.info("Submitting " + uris[0] + "->" + uris[1])
+                logging.info("Submitting %s->%s", uris[0], uris[1])
                 job_id = client.submit_job(uris[0], uris[1], args.only_tables, args.skip_tables, args.update, args.drop, args.convert_innodb, args.skip_optimize, args.email)
-                logging.info('Job submitted with ID '+str(job_id))
+                logging.info('Job submitted with ID %s', job_id)
 
     elif args.action == 'retrieve':
 
@@ -166,7 +166,7 @@ if __name__ == '__main__':
 
     elif args.action == 'delete':
         client.delete_job(args.job_id)
-        logging.info("Job " + str(args.job_id) + " was successfully deleted")
+        logging.info("Job %s was successfully deleted", args.job_id)
 
     elif args.action == 'email':
         client.job_email(args.job_id, args.email)
@@ -1,11 +1,11 @@
-import json
+import orjson
 from celery.utils.log import get_task_logger
 from celery.exceptions import Reject
 import requests
 from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 from ensembl_prodinf.email_celery_app import app
-from ensembl_prodinf.utils import send_email
+from ensembl_prodinf.utils import send_email, SmtpSessionPool
 
 
 logger = get_task_logger(__name__)
@@ -13,15 +13,22 @@ logger = get_task_logger(__name__)
 smtp_server = app.conf['smtp_server']
 from_email_address = app.conf['from_email_address']
 retry_wait = app.conf['retry_wait']
+# job statuses meaning the job has not finished yet
+_PENDING_STATES = frozenset({'incomplete', 'running', 'submitted'})
+smtp_pool = SmtpSessionPool(smtp_server)
+# size the connection pool to the number of tasks that may poll concurrently in this worker
+worker_concurrency = app.conf.get('worker_concurrency') or 32
 
-http_adapter = HTTPAdapter(max_retries=Retry(total=3, backoff_factor=1,
+http_adapter = HTTPAdapter(pool_connections=worker_concurrency, pool_maxsize=worker_concurrency,
+                           max_retries=Retry(total=3, backoff_factor=1,
                                              status_forcelist=[429, 500, 502, 503, 504],
                                              method_whitelist=["GET", "PUT", "POST", "DELETE"]))
 
-def http_session():
-    http = requests.Session()
-    http.mount("http://", http_adapter)
-    return http
+# Shared by every task run in this worker process so polling reuses keep-alive connections
+_SESSION = requests.Session()
+_SESSION.mount("http://", http_adapter)
+_SESSION.mount("https://", http_adapter)
+_SESSION.headers.update({"Connection": "keep-alive", "Accept": "application/json"})
 
 
 @app.task(bind=True, acks_late=True)
@@ -36,20 +43,20 @@ def email_when_complete(self, url, address):
     # allow infinite retries
     self.max_retries = None
     try:
-        with http_session() as session:
-            response = session.get(url)
-        result = response.json()
+        # explicit timeout so a stuck socket does not hold a pool slot indefinitely
+        response = _SESSION.get(url, stream=False, timeout=(3.05, 10))
+        result = orjson.loads(response.content)
     except requests.RequestException as e:
         logger.error('RequestsException: %s', e)
         raise self.retry(countdown=retry_wait, max_retries=120)
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         err = 'Invalid response. Status: {} URL: {}'.format(response.status_code, response.url)
-        logger.error('%s Body: %s', err, response.text)
+        logger.error('%s Body: %s', err, response.content[:512])
         raise self.retry(countdown=retry_wait, max_retries=120)
 
     try:
         status = result['status']
-        if status in ('incomplete', 'running', 'submitted'):
+        if status in _PENDING_STATES:
             # job incomplete so retry task after waiting
             raise self.retry(countdown=retry_wait)
         subject = result['subject']
@@ -59,7 +66,7 @@ def email_when_complete(self, url, address):
         logger.error('%s Body: %s', err, response.text)
         raise Reject(err, requeue=False)
     # job complete so send email and complete task
-    send_email(smtp_server=smtp_server,
+    send_email(smtp_pool=smtp_pool,
                from_email_address=from_email_address,
                to_address=address,
                subject=subject,
@@ -76,7 +83,7 @@ def email(self, address, subject, body):
       subject
       body
     """
-    send_email(smtp_server=smtp_server,
+    send_email(smtp_pool=smtp_pool,
                from_email_address=from_email_address,
                address=address,
                subject=subject,
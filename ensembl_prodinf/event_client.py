@@ -79,7 +79,7 @@ if __name__ == '__main__':
 
     if args.action == 'submit':
         job_id = client.submit_job(json.loads(args.event))
-        logging.info('Job submitted with ID '+str(job_id))
+        logging.info('Job submitted with ID %s', job_id)
 
     elif args.action == 'retrieve':
         job = client.retrieve_job(args.process, args.job_id)
@@ -8,6 +8,10 @@ from server_utils import assert_http_uri, assert_mysql_db_uri, assert_email
 from sqlalchemy.engine.url import make_url
 import re
 
+fail_pattern = re.compile("failed|problems")
+successful_pattern = re.compile("successful")
+
+
 class HandoverClient(object):
 
     """
@@ -28,7 +32,7 @@ class HandoverClient(object):
         """
         assert_mysql_db_uri(spec['src_uri'])
         assert_email(spec['contact'])
-        logging.info("Submitting {} for handover".format(spec['src_uri']))
+        logging.info("Submitting %s for handover", spec['src_uri'])
         logging.debug(spec)
         r = requests.post(self.handovers.format(self.uri), json=spec)
         r.raise_for_status()
@@ -51,17 +55,17 @@ class HandoverClient(object):
         """
         report_time = datetime.strptime(handover['report_time'],"%Y-%m-%dT%H:%M:%S.%f")
         if 'current_message' in handover:
-            logging.info("Handover %s (%s) submitted by (%s) - %s on %s" % (handover['handover_token'], handover['src_uri'], handover['contact'], handover['current_message'],report_time.strftime('%d-%m-%Y %H:%M')))
+            logging.info("Handover %s (%s) submitted by (%s) - %s on %s", handover['handover_token'], handover['src_uri'], handover['contact'], handover['current_message'], report_time.strftime('%d-%m-%Y %H:%M'))
         elif 'message' in handover:
-            logging.info("Handover %s (%s) submitted by (%s) - %s on %s" % (handover['handover_token'], handover['src_uri'], handover['contact'], handover['message'], report_time.strftime('%d-%m-%Y %H:%M')))
+            logging.info("Handover %s (%s) submitted by (%s) - %s on %s", handover['handover_token'], handover['src_uri'], handover['contact'], handover['message'], report_time.strftime('%d-%m-%Y %H:%M'))
 
     def retrieve_handover(self, handover_token):
         """
         Retrieve a handover using an handover_token
         Arguments:
-          handover_token: handover token, e.g: 56bf1f7e-ebdf-11e8-8afa-005056ab4d6f
+          handover_token: handover token, e.g: 56bf1f7eebdf41e88afa005056ab4d6f
         """
-        logging.info("Retrieving details for handover " + str(handover_token))
+        logging.info("Retrieving details for handover %s", handover_token)
         r = requests.get(self.handover_token.format(self.uri,str(handover_token)))
         r.raise_for_status()
         return r.json()
@@ -73,10 +77,8 @@ class HandoverClient(object):
         If a database was handed over multiple times, the latest one will be displayed.
         Print everything
         """
-        fail_pattern = re.compile(".*(failed|problems).*")
-        successful_pattern = re.compile(".*successful.*")
         summary={}
-        logging.info("Retrieving handovers for " + str(email))
+        logging.info("Retrieving handovers for %s", email)
         for handover in handovers:
             if handover['contact'] == email:
                 src_uri = make_url(handover['src_uri'])
@@ -84,11 +86,11 @@ class HandoverClient(object):
                     summary[src_uri.database] = handover
         for sum in summary:
             handover_result = "in progress"
-            if fail_pattern.match(summary[sum]['current_message']):
+            if fail_pattern.search(summary[sum]['current_message']):
                 handover_result = "failed"
-            elif successful_pattern.match(summary[sum]['current_message']):
+            elif successful_pattern.search(summary[sum]['current_message']):
                 handover_result = "success"
-            logging.info("Handover %s - %s : %s" % (summary[sum]['handover_token'],sum, handover_result))
+            logging.info("Handover %s - %s : %s", summary[sum]['handover_token'], sum, handover_result)
 
 if __name__ == '__main__':
 
@@ -122,7 +124,7 @@ if __name__ == '__main__':
             }
         logging.debug(spec)
         handover_id = client.submit_handover(spec)
-        logging.info('Job submitted with transaction ID '+str(handover_id))
+        logging.info('Job submitted with transaction ID %s', handover_id)
     elif args.action == 'list':
         handovers = client.list_handovers()
         for handover in handovers:
@@ -134,4 +136,4 @@ if __name__ == '__main__':
         handovers = client.list_handovers()
         client.handover_summary_email(handovers,args.email)
     else:
-        logging.error("Action "+args.action+" not supported")
+        logging.error("Action %s not supported", args.action)
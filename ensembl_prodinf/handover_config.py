@@ -59,3 +59,8 @@ production_email = os.environ.get("PRODUCTION_EMAIL" ,
 allowed_divisions = os.environ.get("ALLOWED_DIVISIONS" ,
                                         file_config.get('allowed_divisions',
                                                         'vertebrates'))
+# Seconds during which an identical handover submission returns the existing token.
+# Failed handovers cannot be cleared from the web process, so this only needs to cover
+# repeated submissions of the same request (e.g. double clicks or client retries).
+handover_memo_ttl = int(os.environ.get("HANDOVER_MEMO_TTL",
+                                      file_config.get('handover_memo_ttl', 60)))
@@ -2,17 +2,19 @@
 Tasks and entrypoint need to accept and sequentially process a database.
 The data flow is:
 1. handover_database (standard function)
+- creates a handover token and submits celery task bootstrap_handover
+2. bootstrap_handover (celery task)
 - checks existence of database
-- submits HCs if appropriate and submits celery task process_checked_db
-- if not, submits copy and submits celery task process_copied_db
-2. process_checked_db (celery task)
-- wait/retry until healthcheck job has completed
-- if success, submit copy job and submits celery task process_copied_db
-3. process_copied_db (celery task)
-- wait/retry until copy job has completed
-- if success, submit metadata update job and submit celery task process_db_metadata
-4. process_db_metadata (celery task)
-- wait/retry until metadara load job has completed
+- starts a celery chain of the following tasks, each passing the updated spec to the next
+  and notifying the submitter by email (notify_failure) if any of them fails
+3. submit_dc and process_datachecked_db (celery tasks)
+- submit datacheck job and wait/retry until it has completed
+- if problems are found, send email and stop the chain
+4. submit_copy and process_copied_db (celery tasks)
+- submit copy job and wait/retry until it has completed
+- if failure, send email and stop the chain
+5. submit_metadata_update and process_db_metadata (celery tasks, not run for GRCh37)
+- submit metadata update job and wait/retry until it has completed
 - if success, process event using a event handler endpoint celery task
 @author: dstaines
 '''
@@ -20,8 +22,14 @@ The data flow is:
 import logging
 import json
 import uuid
+import hashlib
+import random
 import re
+import threading
+import time
 
+from celery import chain
+from celery.exceptions import Ignore
 from ensembl_prodinf.handover_celery_app import app
 
 from ensembl_prodinf.db_copy_client import DbCopyClient
@@ -30,7 +38,8 @@ from ensembl_prodinf.event_client import EventClient
 from ensembl.datacheck.client import DatacheckClient
 from sqlalchemy_utils.functions import database_exists, drop_database
 from sqlalchemy.engine.url import make_url
-from ensembl_prodinf.utils import send_email
+from sqlalchemy.exc import OperationalError
+from ensembl_prodinf.utils import send_email, SmtpSessionPool
 from ensembl_prodinf.models.compara import check_grch37, get_release_compara
 from ensembl_prodinf.models.core import get_division, get_release
 from ensembl_prodinf import handover_config as cfg
@@ -45,10 +54,13 @@ release = int(handover_config.RELEASE)
 
 
 retry_wait = app.conf.get('retry_wait',60)
+# job statuses meaning the job has not finished yet
+_PENDING_STATES = frozenset({'incomplete', 'running', 'submitted'})
 db_copy_client = DbCopyClient(cfg.copy_uri)
 metadata_client = MetadataClient(cfg.meta_uri)
 event_client = EventClient(cfg.event_uri)
 dc_client = DatacheckClient(cfg.dc_uri)
+smtp_pool = SmtpSessionPool(cfg.smtp_server)
 
 db_types_list = [i for i in cfg.allowed_database_types.split(",")]
 allowed_divisions_list = [i for i in cfg.allowed_divisions.split(",")]
@@ -73,6 +85,10 @@ blat_species = ['homo_sapiens',
 
 logger = logging.getLogger(__name__)
 
+# handover tokens of recently submitted handovers, keyed by handover_key
+_handover_memo = {}
+_handover_memo_lock = threading.Lock()
+
 handover_formatter = ReportFormatter('handover')
 publisher = AMQPPublisher(cfg.report_server,
                           cfg.report_exchange,
@@ -89,6 +105,38 @@ def log_and_publish(report):
     publisher.publish(report, routing_key)
 
 
+def retry_countdown(retries, base, cap):
+    """Exponential backoff with jitter: number of seconds to wait before the next retry"""
+    return min(cap, base * 2 ** retries) + random.uniform(0, base)
+
+
+def handover_key(spec):
+    """Key identifying a handover submission, used to detect duplicate submissions"""
+    key = '%s|%s|%s' % (spec['src_uri'], spec.get('type'), spec.get('comment'))
+    return hashlib.sha1(key.encode()).hexdigest()
+
+
+def memoize_handover(key, handover_token):
+    """Record handover_token for key unless a handover with the same key was submitted less
+    than handover_memo_ttl seconds ago. Returns the token of that earlier handover, or None"""
+    now = time.time()
+    with _handover_memo_lock:
+        existing = _handover_memo.get(key)
+        if existing and existing[1] > now:
+            return existing[0]
+        # drop expired entries so the memo does not grow for the life of the process
+        for expired_key in [k for k, (_, expiry) in _handover_memo.items() if expiry <= now]:
+            del _handover_memo[expired_key]
+        _handover_memo[key] = (handover_token, now + cfg.handover_memo_ttl)
+        return None
+
+
+def forget_handover(key):
+    """Remove the record of a handover so that it can be submitted again"""
+    with _handover_memo_lock:
+        _handover_memo.pop(key, None)
+
+
 def handover_database(spec):
     """ Method to accept a new database for incorporation into the system
     Argument is a dict with the following keys:
@@ -103,37 +151,53 @@ def handover_database(spec):
     * metadata_job_id - job ID for the metadata loading process
     * progress_total - Total number of task to do
     * progress_complete - Total number of task completed
+    The database is checked and submitted by the bootstrap_handover task, so the
+    handover_token is returned straight away and any problem is reported against it
+    by notify_failure.
+    If an identical handover was submitted recently, its handover_token is returned and
+    no new processing is started.
     """
     # TODO verify dict
-    src_uri = spec['src_uri']
+    key = handover_key(spec)
     # create unique identifier
-    spec['handover_token'] = str(uuid.uuid1())
+    handover_token = uuid.uuid4().hex
+    existing_token = memoize_handover(key, handover_token)
+    if existing_token:
+        logger.info("Handover of %s already submitted as %s", spec['src_uri'], existing_token)
+        return existing_token
+    spec['handover_token'] = handover_token
+    try:
+        bootstrap_handover.apply_async((spec,), link_error=notify_failure.s(spec))
+    except Exception:
+        forget_handover(key)
+        raise
+    return handover_token
+
+
+@app.task(bind=True, autoretry_for=(OperationalError,), default_retry_delay=retry_wait, max_retries=3)
+def bootstrap_handover(self, spec):
+    """Task to check the database and submit it for datachecks. Returns the handover_token.
+    Retried if the source database server cannot be reached. Any failure is reported
+    by notify_failure, attached as link_error by handover_database"""
+    src_uri = spec['src_uri']
     spec['progress_total'] = 3
     if not database_exists(src_uri):
-        msg = "Handover failed, %s does not exist" % src_uri
-        log_and_publish(make_report('ERROR', msg, spec, src_uri))
         raise ValueError("%s does not exist" % src_uri)
     src_url = make_url(src_uri)
     #Scan database name and retrieve species or compara name, database type, release number and assembly version
     db_prefix, db_type, assembly = parse_db_infos(src_url.database)
     # Check if the given database can be handed over
     if db_type not in db_types_list:
-        msg = "Handover failed, %s has been handed over after deadline. Please contact the Production team" % src_uri
-        log_and_publish(make_report('ERROR', msg, spec, src_uri))
-        raise ValueError(msg)
+        raise ValueError("%s has been handed over after deadline. Please contact the Production team" % src_uri)
     # Check if the database release match the handover service
     if db_type == 'compara':
         compara_release = get_release_compara(src_uri)
         if release != compara_release:
-            msg = "Handover failed, %s database release version %s does not match handover service release version %s" % (src_uri,compara_release,release)
-            log_and_publish(make_report('ERROR', msg, spec, src_uri))
-            raise ValueError(msg)
+            raise ValueError("%s database release version %s does not match handover service release version %s" % (src_uri,compara_release,release))
     else:
         db_release=get_release(src_uri)
         if release != db_release:
-            msg = "Handover failed, %s database release version %s does not match handover service release version %s" % (src_uri,db_release,release)
-            log_and_publish(make_report('ERROR', msg, spec, src_uri))
-            raise ValueError(msg)
+            raise ValueError("%s database release version %s does not match handover service release version %s" % (src_uri,db_release,release))
     #Check to which staging server the database need to be copied to
     spec, staging_uri, live_uri = check_staging_server(spec, db_type, db_prefix, assembly)
     if 'tgt_uri' not in spec:
@@ -149,7 +213,11 @@ def handover_database(spec):
     spec['progress_complete'] = 0
     msg = "Handling %s" % spec
     log_and_publish(make_report('INFO', msg, spec, src_uri))
-    submit_dc(spec, src_url, db_type)
+    steps = [submit_dc.s(spec, db_type), process_datachecked_db.s(),
+             submit_copy.s(), process_copied_db.s()]
+    if 'GRCh37' not in spec:
+        steps += [submit_metadata_update.s(), process_db_metadata.s()]
+    chain(*steps).apply_async(link_error=notify_failure.s(spec))
     return spec['handover_token']
 
 
@@ -160,24 +228,23 @@ def get_tgt_uri(src_url, staging_uri):
 
 def parse_db_infos(database):
     """Parse database name and extract db_prefix and db_type. Also extract release and assembly for species databases"""
-    if species_pattern.match(database):
-        m = species_pattern.match(database)
+    m = species_pattern.match(database)
+    if m:
         db_prefix = m.group('prefix')
         db_type = m.group('type')
         assembly = m.group('assembly')
         return db_prefix, db_type, assembly
-    elif compara_pattern.match(database):
-        m = compara_pattern.match(database)
+    m = compara_pattern.match(database)
+    if m:
         division = m.group('division')
         db_prefix = division if division else 'vertebrates'
         return db_prefix, 'compara', None
-    elif ancestral_pattern.match(database):
-        m = ancestral_pattern.match(database)
+    m = ancestral_pattern.match(database)
+    if m:
         division = m.group('division')
         db_prefix = division if division else 'vertebrates'
         return db_prefix, 'ancestral', None
-    else:
-        raise ValueError("Database type for %s is not expected. Please contact the Production team" % database)
+    raise ValueError("Database type for %s is not expected. Please contact the Production team" % database)
 
 
 def check_staging_server(spec,db_type,db_prefix,assembly):
@@ -200,10 +267,26 @@ def check_staging_server(spec,db_type,db_prefix,assembly):
         live_uri = cfg.live_uri
     return spec, staging_uri, live_uri
 
-def submit_dc(spec, src_url, db_type):
-    """Submit the source database for checking. Returns a celery job identifier"""
+
+@app.task
+def notify_failure(request, exc, traceback, spec):
+    """Error callback for bootstrap_handover and the handover chain: report the failure and email
+    the submitter. These tasks leave the ERROR report to this callback and just raise"""
+    src_uri = spec['src_uri']
+    log_and_publish(make_report('ERROR', 'Handover failed, %s' % exc, spec, src_uri))
+    msg = """
+Handover of %s failed in task %s:
+%s
+""" % (src_uri, request.task, exc)
+    send_email(to_address=spec['contact'], subject='Handover failed', body=msg, smtp_pool=smtp_pool)
+
+
+@app.task
+def submit_dc(spec, db_type):
+    """Submit the source database for checking. Returns the spec with dc_job_id set"""
+    src_uri = spec['src_uri']
+    src_url = make_url(src_uri)
     try:
-        src_uri = spec['src_uri']
         tgt_uri = spec['tgt_uri']
         handover_token = spec['handover_token']
         server_url = 'mysql://%s@%s:%s/' % (src_url.username, src_url.host, src_url.port)
@@ -232,36 +315,32 @@ def submit_dc(spec, src_url, db_type):
             dc_job_id = dc_client.submit_job(server_url, src_url.database, None, None,
                     db_type, None, db_type, 'critical', None, handover_token)
     except Exception as e:
-        err_msg = 'Handover failed, Cannot submit dc job'
-        log_and_publish(make_report('ERROR', err_msg, spec, src_uri))
-        raise ValueError('Handover failed, Cannot submit dc job %s' % e) from e
+        raise ValueError('cannot submit dc job %s' % e) from e
     spec['dc_job_id'] = dc_job_id
-    task_id = process_datachecked_db.delay(dc_job_id, spec)
-    submitted_dc_msg = 'Submitted DB for checking as %s' % task_id
+    submitted_dc_msg = 'Submitted DB for checking as %s' % dc_job_id
     log_and_publish(make_report('DEBUG', submitted_dc_msg, spec, src_uri))
-    return task_id
+    return spec
 
 
 @app.task(bind=True, default_retry_delay=retry_wait)
-def process_datachecked_db(self, dc_job_id, spec):
+def process_datachecked_db(self, spec):
     """ Task to wait until DCs finish and then respond e.g.
-    * submit copy if DC succeed
-    * send error email if not
+    * pass the spec on to the copy if DC succeed
+    * send error email and stop the chain if not
     """
     # allow infinite retries
     self.max_retries = None
     src_uri = spec['src_uri']
+    dc_job_id = spec['dc_job_id']
     progress_msg = 'Datachecks in progress, please see: %sjobs/%s' % (cfg.dc_uri, dc_job_id)
     log_and_publish(make_report('INFO', progress_msg, spec, src_uri))
     try:
         result = dc_client.retrieve_job(dc_job_id)
     except Exception as e:
-        err_msg = 'Handover failed, cannot retrieve datacheck job'
-        log_and_publish(make_report('ERROR', err_msg, spec, src_uri))
-        raise ValueError('Handover failed, cannot retrieve datacheck job %s' % e) from e
-    if result['status'] in ['incomplete', 'running', 'submitted']:
+        raise ValueError('cannot retrieve datacheck job %s' % e) from e
+    if result['status'] in _PENDING_STATES:
         log_and_publish(make_report('DEBUG', 'Datacheck Job incomplete, checking again later', spec, src_uri))
-        raise self.retry()
+        raise self.retry(countdown=retry_countdown(self.request.retries, base=5, cap=120))
     # check results
     elif result['status'] == 'failed':
         prob_msg = 'Datachecks found problems, you can download the output here: %sdownload_datacheck_outputs/%s' % (cfg.dc_uri, dc_job_id)
@@ -270,47 +349,46 @@ def process_datachecked_db(self, dc_job_id, spec):
 Running datachecks on %s completed but found problems.
 You can download the output here %s
 """ % (src_uri, cfg.dc_uri + "download_datacheck_outputs/" + str(dc_job_id))
-        send_email(to_address=spec['contact'], subject='Datacheck found problems', body=msg, smtp_server=cfg.smtp_server)
-    else:
-        log_and_publish(make_report('INFO', 'Datachecks successful, starting copy', spec, src_uri))
-        spec['progress_complete'] = 1
-        submit_copy(spec)
+        send_email(to_address=spec['contact'], subject='Datacheck found problems', body=msg, smtp_pool=smtp_pool)
+        raise Ignore()
+    log_and_publish(make_report('INFO', 'Datachecks successful, starting copy', spec, src_uri))
+    spec['progress_complete'] = 1
+    return spec
 
 
+@app.task
 def submit_copy(spec):
-    """Submit the source database for copying to the target. Returns a celery job identifier"""
+    """Submit the source database for copying to the target. Returns the spec with copy_job_id set"""
     src_uri = spec['src_uri']
     try:
         copy_job_id = db_copy_client.submit_job(src_uri, spec['tgt_uri'], None, None,
                                                 False, True, True, None, None)
     except Exception as e:
-        log_and_publish(make_report('ERROR', 'Handover failed, cannot submit copy job', spec, src_uri))
-        raise ValueError('Handover failed, cannot submit copy job %s' % e) from e
+        raise ValueError('cannot submit copy job %s' % e) from e
     spec['copy_job_id'] = copy_job_id
-    task_id = process_copied_db.delay(copy_job_id, spec)
-    dbg_msg = 'Submitted DB for copying as %s' % task_id
-    log_and_publish(make_report('DEBUG', 'Handover failed, cannot submit copy job', spec, src_uri))
-    return task_id
+    dbg_msg = 'Submitted DB for copying as %s' % copy_job_id
+    log_and_publish(make_report('DEBUG', dbg_msg, spec, src_uri))
+    return spec
 
 
 @app.task(bind=True, default_retry_delay=retry_wait)
-def process_copied_db(self, copy_job_id, spec):
+def process_copied_db(self, spec):
     """Wait for copy to complete and then respond accordingly:
-    * if success, submit to metadata database
-    * if failure, flag error using email"""
+    * if success, pass the spec on to the metadata update
+    * if failure, flag error using email and stop the chain"""
     # allow infinite retries
     self.max_retries = None
     src_uri = spec['src_uri']
+    copy_job_id = spec['copy_job_id']
     copy_in_progress_msg = 'Copying in progress, please see: %s%s' % (cfg.copy_web_uri, copy_job_id)
     log_and_publish(make_report('INFO', copy_in_progress_msg, spec, src_uri))
     try:
         result = db_copy_client.retrieve_job(copy_job_id)
     except Exception as e:
-        log_and_publish(make_report('ERROR', 'Handover failed, cannot retrieve copy job', spec, src_uri))
-        raise ValueError('Handover failed, cannot retrieve copy job %s' % e) from e
-    if result['status'] in ['incomplete', 'running', 'submitted']:
+        raise ValueError('cannot retrieve copy job %s' % e) from e
+    if result['status'] in _PENDING_STATES:
         log_and_publish(make_report('DEBUG', 'Database copy job incomplete, checking again later', spec, src_uri))
-        raise self.retry()
+        raise self.retry(countdown=retry_countdown(self.request.retries, base=30, cap=600))
     if result['status'] == 'failed':
         copy_failed_msg = 'Copy failed, please see: %s%s' % (cfg.copy_web_uri, copy_job_id)
         log_and_publish(make_report('INFO', copy_failed_msg, spec, src_uri))
@@ -318,50 +396,47 @@ def process_copied_db(self, copy_job_id, spec):
 Copying %s to %s failed.
 Please see %s
 """ % (src_uri, spec['tgt_uri'], cfg.copy_web_uri + str(copy_job_id))
-        send_email(to_address=spec['contact'], subject='Database copy failed', body=msg, smtp_server=cfg.smtp_server)
-        return
+        send_email(to_address=spec['contact'], subject='Database copy failed', body=msg, smtp_pool=smtp_pool)
+        raise Ignore()
     elif 'GRCh37'in spec:
         log_and_publish(make_report('INFO', 'Copying complete, Handover successful', spec, src_uri))
-        spec['progress_complete'] = 2
     else:
         log_and_publish(make_report('INFO', 'Copying complete, submitting metadata job', spec, src_uri))
-        spec['progress_complete'] = 2
-        submit_metadata_update(spec)
+    spec['progress_complete'] = 2
+    return spec
 
 
+@app.task
 def submit_metadata_update(spec):
-    """Submit the source database for copying to the target. Returns a celery job identifier."""
+    """Submit the target database for loading into the metadata database. Returns the spec with metadata_job_id set"""
     src_uri = spec['src_uri']
     try:
         metadata_job_id = metadata_client.submit_job(spec['tgt_uri'], None, None, None,
                 None, spec['contact'], spec['comment'], 'Handover', None)
     except Exception as e:
-        log_and_publish(make_report('ERROR', 'Handover failed, cannot submit metadata job', spec, src_uri))
-        raise ValueError('Handover failed, cannot submit metadata job %s' % e) from e
+        raise ValueError('cannot submit metadata job %s' % e) from e
     spec['metadata_job_id'] = metadata_job_id
-    task_id = process_db_metadata.delay(metadata_job_id, spec)
-    dbg_msg = 'Submitted DB for metadata loading %s' % task_id
+    dbg_msg = 'Submitted DB for metadata loading %s' % metadata_job_id
     log_and_publish(make_report('DEBUG', dbg_msg, spec, src_uri))
-    return task_id
+    return spec
 
 
 @app.task(bind=True, default_retry_delay=retry_wait)
-def process_db_metadata(self, metadata_job_id, spec):
+def process_db_metadata(self, spec):
     """Wait for metadata update to complete and then respond accordingly:
     * if success, submit event to event handler for further processing
     * if failure, flag error using email"""
     # allow infinite retries
     self.max_retries = None
     tgt_uri = spec['tgt_uri']
+    metadata_job_id = spec['metadata_job_id']
     loading_msg = 'Loading into metadata database, please see: %sjobs/%s' % (cfg.meta_uri, metadata_job_id)
     log_and_publish(make_report('INFO', loading_msg, spec, tgt_uri))
     try:
         result = metadata_client.retrieve_job(metadata_job_id)
     except Exception as e:
-        err_msg = 'Handover failed, Cannot retrieve metadata job'
-        log_and_publish(make_report('ERROR', err_msg, spec, tgt_uri))
-        raise ValueError('Handover failed, Cannot retrieve metadata job %s' % e) from e
-    if result['status'] in ['incomplete', 'running', 'submitted']:
+        raise ValueError('cannot retrieve metadata job %s' % e) from e
+    if result['status'] in _PENDING_STATES:
         incomplete_msg = 'Metadata load Job incomplete, checking again later'
         log_and_publish(make_report('DEBUG', incomplete_msg, spec, tgt_uri))
         raise self.retry()
@@ -375,7 +450,7 @@ def process_db_metadata(self, metadata_job_id, spec):
 Metadata load of %s failed.
 Please see %s
 """ % (tgt_uri, cfg.meta_uri + 'jobs/' + str(metadata_job_id) + '?format=failures')
-        send_email(to_address=spec['contact'], subject='Metadata load failed, please see: '+cfg.meta_uri+ 'jobs/' + str(metadata_job_id) + '?format=failures', body=msg, smtp_server=cfg.smtp_server)
+        send_email(to_address=spec['contact'], subject='Metadata load failed, please see: '+cfg.meta_uri+ 'jobs/' + str(metadata_job_id) + '?format=failures', body=msg, smtp_pool=smtp_pool)
     else:
         # Cleaning up old assembly or old genebuild databases for Wormbase when database suffix has changed
         if 'events' in result['output'] and result['output']['events']:
@@ -387,11 +462,12 @@ Please see %s
                     msg = 'The following species %s has a new assembly, please update the port number for this species here and communicate to Web: https://github.com/Ensembl/ensembl-production/blob/master/modules/Bio/EnsEMBL/Production/Pipeline/PipeConfig/DumpCore_conf.pm#L107' % event['genome']
                     send_email(to_address=cfg.production_email,
                                subject='BLAT species list needs updating in FTP Dumps config',
-                               body=msg)
+                               body=msg, smtp_pool=smtp_pool)
         log_and_publish(make_report('INFO', 'Metadata load complete, Handover successful', spec, tgt_uri))
         spec['progress_complete'] = 3
         #log_and_publish(make_report('INFO', 'Metadata load complete, submitting event', spec, tgt_uri))
         #submit_event(spec,result)
+    return spec
 
 
 def submit_event(spec, result):
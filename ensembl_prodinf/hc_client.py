@@ -55,7 +55,7 @@ class HcClient(RestClient):
           pattern - optional pattern to filter jobs by
           failure_only - only report failed jobs
         """
-        logging.info("Finding jobs matching {}".format(pattern))
+        logging.info("Finding jobs matching %s", pattern)
         r = super(HcClient, self).list_jobs()
         re_pattern = re.compile(pattern)
         output = []
@@ -76,7 +76,7 @@ class HcClient(RestClient):
           output_file - optional file to write report
           pattern - optional pattern to filter jobs tags by
         """
-        logging.info("Collating jobs using tag " + str(pattern))
+        logging.info("Collating jobs using tag %s", pattern)
         r = super(HcClient, self).list_jobs()
         re_pattern = re.compile(pattern)
         output = defaultdict(list)
@@ -84,20 +84,20 @@ class HcClient(RestClient):
             try:
                 job_id = job['id']
                 if re_pattern.match(job['input']['tag']) and ('output' in job and job['output']['status'] == 'failed'):
-                    logging.info("Found tag " + str(pattern) + " for job: " + str(job_id))
+                    logging.info("Found tag %s for job: %s", pattern, job_id)
                     for h, r in {k: v for k, v in job['output']['results'].items() if v['status'] == 'failed'}.items():
                         [output[h].append(job['input']['db_uri']+"\t"+m) for m in r['messages']]
                 elif re_pattern.match(job['input']['tag']) and ( job['status'] == 'incomplete' or job['status'] == "submitted"):
-                    logging.info("WARNING: job: " + str(job_id) + " for tag " + str(pattern) + " is still running, skipping it ")
+                    logging.info("WARNING: job: %s for tag %s is still running, skipping it ", job_id, pattern)
                 elif re_pattern.match(job['input']['tag']) and job['output']['status'] == 'passed':
-                    logging.info("INFO: job: " + str(job_id) + " for tag " + str(pattern) + " has no failure, skipping it")
+                    logging.info("INFO: job: %s for tag %s has no failure, skipping it", job_id, pattern)
             except:
                 job_id = job['id']
                 if job['status'] == 'failed':
                     failed_job = super(HcClient, self).retrieve_job(job_id)
                     if 'tag' in failed_job['input']:
                         if re_pattern.match(failed_job['input']['tag']):
-                            logging.info("WARNING: job: " + str(failed_job['id']) + " for tag " + str(pattern) + " has failed, please check error message")
+                            logging.info("WARNING: job: %s for tag %s has failed, please check error message", failed_job['id'], pattern)
         if output_file != None:
             output_file.write(json.dumps(output))
 
@@ -109,45 +109,45 @@ class HcClient(RestClient):
           print_results : set to True to print detailed results
           print_input : set to True to print input for job
         """
-        logging.info("Job %s (%s) - %s" % (job['id'], job['input']['db_uri'], job['status']))
+        logging.info("Job %s (%s) - %s", job['id'], job['input']['db_uri'], job['status'])
         if print_input == True:
             self.print_inputs(job['input'])
         if job['status'] == 'complete':
             if print_results == True:
-                logging.info("HC result: " + str(job['output']['status']))
+                logging.info("HC result: %s", job['output']['status'])
                 for (hc, result) in job['output']['results'].items():
-                    logging.info("%s : %s" % (hc, result['status']))
+                    logging.info("%s : %s", hc, result['status'])
                     if result['messages'] != None:
                         for msg in result['messages']:
                             logging.info(msg)
         elif job['status'] == 'incomplete':
             if print_results == True:
-                logging.info("HC result: " + str(job['status']))
-                logging.info(str(job['progress']['complete'])+"/"+str(job['progress']['total'])+" job complete")
+                logging.info("HC result: %s", job['status'])
+                logging.info("%s/%s job complete", job['progress']['complete'], job['progress']['total'])
         elif job['status'] == 'failed':
             failures = self.retrieve_job_failure(job['id'])
-            logging.info("Job failed with error: "+ str(failures))
+            logging.info("Job failed with error: %s", failures)
         else:
             raise ValueError("Unknown status {}".format(job['status']))
 
     def print_inputs(self,i):
         """Utility to render a job input dict to logging"""
-        logging.info("DB URI: " + i['db_uri'])
-        logging.info("Staging URI: " + i['staging_uri'])
-        logging.info("Live URI: " + i['live_uri'])
-        logging.info("Compara URI: " + i['compara_uri'])
-        logging.info("Production URI: " + i['production_uri'])
-        logging.info("Data files path: " + i['data_files_path'])
+        logging.info("DB URI: %s", i['db_uri'])
+        logging.info("Staging URI: %s", i['staging_uri'])
+        logging.info("Live URI: %s", i['live_uri'])
+        logging.info("Compara URI: %s", i['compara_uri'])
+        logging.info("Production URI: %s", i['production_uri'])
+        logging.info("Data files path: %s", i['data_files_path'])
         if 'hc_names' in i:
             for hc in i['hc_names']:
-                logging.info("HC: " + hc)
+                logging.info("HC: %s", hc)
         if 'hc_groups' in i:
             for hc in i['hc_groups']:
-                logging.info("HC: " + hc)
+                logging.info("HC: %s", hc)
         if 'email' in i:
-            logging.info("Email: " + i['email'])
+            logging.info("Email: %s", i['email'])
         if 'tag' in i:
-            logging.info("Tag: " + i['tag'])
+            logging.info("Tag: %s", i['tag'])
 
 if __name__ == '__main__':
 
@@ -185,7 +185,7 @@ if __name__ == '__main__':
 
     if args.action == 'submit':
         job_id = client.submit_job(args.db_uri, args.production_uri, args.compara_uri, args.staging_uri, args.live_uri, args.hc_names, args.hc_groups, args.data_files_path, args.email, args.tag)
-        logging.info('Job submitted with ID '+str(job_id))
+        logging.info('Job submitted with ID %s', job_id)
 
     elif args.action == 'retrieve':
         job = client.retrieve_job(args.job_id)
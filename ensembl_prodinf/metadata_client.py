@@ -29,32 +29,32 @@ class MetadataClient(RestClient):
         return super(MetadataClient, self).submit_job(payload)
         
     def print_job(self, job, print_results=False, print_input=False):
-        logging.info("Job %s (%s) to (%s) - %s" % (job['id'], job['input']['metadata_uri'], job['input']['database_uri'], job['status']))
+        logging.info("Job %s (%s) to (%s) - %s", job['id'], job['input']['metadata_uri'], job['input']['database_uri'], job['status'])
         if print_input == True:
             self.print_inputs(job['input'])
         if job['status'] == 'complete':
             if print_results == True:
-                logging.info("Load result: " + str(job['status']))
-                logging.info("Load took: " +str(job['output']['runtime']))
+                logging.info("Load result: %s", job['status'])
+                logging.info("Load took: %s", job['output']['runtime'])
         elif job['status'] == 'running':
             if print_results == True:
-                logging.info("Load result: " + str(job['status']))
-                logging.info(str(job['progress']['complete'])+"/"+str(job['progress']['total'])+" task complete")
-                logging.info("Status: "+str(job['progress']['message']))
+                logging.info("Load result: %s", job['status'])
+                logging.info("%s/%s task complete", job['progress']['complete'], job['progress']['total'])
+                logging.info("Status: %s", job['progress']['message'])
         elif job['status'] == 'failed':
             failure_msg = self.retrieve_job_failure(job['id'])
-            logging.info("Job failed with error: "+ str(failure_msg['msg']))
+            logging.info("Job failed with error: %s", failure_msg['msg'])
 
     def print_inputs(self,i):
-        logging.info("database URI: " + i['database_uri'])
-        logging.info("Ensembl release number: " + i['e_release'])
-        logging.info("Release date: " + i['release_date'])
-        logging.info("Is it the current release: " + i['current_release'])
+        logging.info("database URI: %s", i['database_uri'])
+        logging.info("Ensembl release number: %s", i['e_release'])
+        logging.info("Release date: %s", i['release_date'])
+        logging.info("Is it the current release: %s", i['current_release'])
         if 'eg_release' in i:
-            logging.info("EG release number: " + i['eg_release'])
-            logging.info("Email of submitter: " + i['email'])
-            logging.info("Comment: " + i['comment'])
-            logging.info("Source: " + i['source'])
+            logging.info("EG release number: %s", i['eg_release'])
+            logging.info("Email of submitter: %s", i['email'])
+            logging.info("Comment: %s", i['comment'])
+            logging.info("Source: %s", i['source'])
 
 if __name__ == '__main__':
             
@@ -93,19 +93,19 @@ if __name__ == '__main__':
             
     if args.action == 'submit':
         if args.input_file == None and args.email_notification == None:
-            logging.info("Submitting " + args.database_uri + " for metadata load")
+            logging.info("Submitting %s for metadata load", args.database_uri)
             job_id = client.submit_job(args.database_uri, args.e_release, args.eg_release, args.release_date, args.current_release, args.email, args.comment, args.source, None)
-            logging.info('Job submitted with ID '+str(job_id))
+            logging.info('Job submitted with ID %s', job_id)
         elif args.input_file == None:
-            logging.info("Submitting " + args.database_uri + " for metadata load")
+            logging.info("Submitting %s for metadata load", args.database_uri)
             job_id = client.submit_job(args.database_uri, args.e_release, args.eg_release, args.release_date, args.current_release, args.email, args.comment, args.source, args.email_notification)
-            logging.info('Job submitted with ID '+str(job_id))
+            logging.info('Job submitted with ID %s', job_id)
         else:
             for line in args.input_file:
                 uris = line.split()
-                logging.info("Submitting " + uris[0] + " for metadata load")
+                logging.info("Submitting %s for metadata load", uris[0])
                 job_id = client.submit_job(uris[0], args.e_release, args.eg_release, args.release_date, args.current_release, args.email, args.comment, args.source, None)
-                logging.info('Job submitted with ID '+str(job_id))
+                logging.info('Job submitted with ID %s', job_id)
     
     elif args.action == 'retrieve':
     
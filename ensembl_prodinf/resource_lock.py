@@ -218,7 +218,7 @@ class ResourceLocker:
           LockException if resource cannot be locked
           ValueException if lock type not read or write
         """
-        logging.info("Locking {} for {} for {}".format(client_name, resource_uri, lock_type))
+        logging.info("Locking %s for %s for %s", client_name, resource_uri, lock_type)
         session = Session()
         client = self.get_client(client_name, session)
         resource = self.get_resource(resource_uri, session)
@@ -268,7 +268,7 @@ class ResourceLocker:
             if lock == None:
                 raise ValueError("No lock found for ID "+str(lock))
         try:
-            logging.info("Deleting lock "+str(lock))
+            logging.info("Deleting lock %s", lock)
             self._lock_db(session)
             session.delete(lock)
             session.commit()
@@ -311,7 +311,7 @@ class ResourceLocker:
             if client == None:
                 raise ValueError("No client found for name")
         try:
-            logging.info("Deleting client "+str(client))
+            logging.info("Deleting client %s", client)
             self._lock_db(session)
             session.delete(client)
             session.commit()
@@ -354,7 +354,7 @@ class ResourceLocker:
             if resource == None:
                 raise ValueError("No client found for name")
         try:
-            logging.info("Deleting resource "+str(resource))
+            logging.info("Deleting resource %s", resource)
             self._lock_db(session)
             session.delete(resource)
             session.commit()
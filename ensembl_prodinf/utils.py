@@ -1,10 +1,11 @@
 # Miscellaneous utilities used by the package
 from email.mime.text import MIMEText
-from smtplib import SMTP
+from smtplib import SMTP, SMTPServerDisconnected
 import json
 import logging
 import os
 import pwd
+import threading
 
 
 def get_default_user():
@@ -20,17 +21,65 @@ def get_default_user():
     return default_user
 
 
+class SmtpSessionPool(object):
+    """Keeps one open SMTP connection per thread so that repeated emails reuse the same session.
+    Connections are opened lazily, checked with NOOP before use and reopened if the server has dropped them"""
+
+    def __init__(self, smtp_server='localhost'):
+        self.smtp_server = smtp_server
+        self._local = threading.local()
+
+    def _connect(self):
+        self._local.client = SMTP(self.smtp_server)
+        return self._local.client
+
+    def client(self):
+        """Return a live SMTP connection for the current thread"""
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            return self._connect()
+        try:
+            code, _ = client.noop()
+        except (SMTPServerDisconnected, OSError):
+            code = None
+        if code != 250:
+            self.close()
+            return self._connect()
+        return client
+
+    def sendmail(self, from_address, to_addresses, msg):
+        try:
+            self.client().sendmail(from_address, to_addresses, msg)
+        except SMTPServerDisconnected:
+            self._connect().sendmail(from_address, to_addresses, msg)
+
+    def close(self):
+        """Close the connection held by the current thread"""
+        client = getattr(self._local, 'client', None)
+        self._local.client = None
+        if client is not None:
+            try:
+                client.quit()
+            except (SMTPServerDisconnected, OSError):
+                pass
+
+
 def send_email(**kwargs):
-    """ Utility method for sending an email"""
+    """ Utility method for sending an email.
+    If smtp_pool is supplied, its connection is used instead of opening a new one to smtp_server"""
     logger = kwargs.get('logger', logging)
     from_address = kwargs.get('from_email_address', 'ensembl-production@ebi.ac.uk')
     msg = MIMEText(kwargs['body'])
     msg['Subject'] = kwargs['subject']
     msg['From'] = from_address
     msg['To'] = kwargs['to_address']
-    smtp_server = kwargs.get('smtp_server', 'localhost')
+    smtp_pool = kwargs.get('smtp_pool')
+    smtp_server = smtp_pool.smtp_server if smtp_pool else kwargs.get('smtp_server', 'localhost')
     to_address = kwargs['to_address']
-    logger.debug('sendmail server: {} - Message from: {}, to: {}, subject: {}'.format(smtp_server, from_address, to_address, msg['Subject']))
+    logger.debug('sendmail server: %s - Message from: %s, to: %s, subject: %s', smtp_server, from_address, to_address, msg['Subject'])
+    if smtp_pool:
+        smtp_pool.sendmail(from_address, (to_address,), msg.as_string())
+        return
     s = SMTP(smtp_server)
     s.sendmail(from_address, (to_address,), msg.as_string())
     s.quit()
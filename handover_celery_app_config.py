@@ -15,6 +15,12 @@ from_email_address = os.environ.get("FROM_EMAIL_ADDRESS",
                                     file_config.get('from_email_address', 'ensembl-production@ebi.ac.uk'))
 retry_wait = int(os.environ.get("RETRY_WAIT",
                                 file_config.get('retry_wait', 60)))
+task_serializer = os.environ.get("TASK_SERIALIZER",
+                                 file_config.get('task_serializer', 'msgpack'))
+result_serializer = os.environ.get("RESULT_SERIALIZER",
+                                   file_config.get('result_serializer', 'msgpack'))
+# json is still accepted so that tasks queued before a serializer change can be consumed
+accept_content = list({task_serializer, result_serializer, 'json'})
 
 task_routes = {
     os.environ.get("ROUTING_KEY",
@@ -1,4 +1,5 @@
 from ensembl_prodinf import handover_tasks as ht
+from unittest import mock
 import unittest
 
 
@@ -104,3 +105,87 @@ class ParseDbInfosTest(unittest.TestCase):
         for invalid_database_name in invalid_names:
             self.assertRaises(ValueError, ht.parse_db_infos, invalid_database_name)
 
+
+class RetryCountdownTest(unittest.TestCase):
+    def test_backoff_increases(self):
+        delays = [ht.retry_countdown(retries, base=5, cap=120) for retries in range(1, 5)]
+        self.assertEqual(sorted(delays), delays)
+        self.assertEqual(len(set(delays)), len(delays))
+
+    def test_backoff_is_capped(self):
+        for retries in (10, 50, 1000):
+            countdown = ht.retry_countdown(retries, base=5, cap=120)
+            self.assertGreaterEqual(countdown, 120)
+            self.assertLessEqual(countdown, 125)
+
+
+class MemoizeHandoverTest(unittest.TestCase):
+    def test_duplicate_handover_returns_first_token(self):
+        spec = {'src_uri': 'mysql://user@host:3306/homo_sapiens_core_100_38', 'type': 'other', 'comment': 'test'}
+        key = ht.handover_key(spec)
+        self.assertIsNone(ht.memoize_handover(key, 'token1'))
+        self.assertEqual('token1', ht.memoize_handover(key, 'token2'))
+        ht.forget_handover(key)
+        self.assertIsNone(ht.memoize_handover(key, 'token3'))
+        ht.forget_handover(key)
+
+    def test_different_comment_is_not_duplicate(self):
+        spec = {'src_uri': 'mysql://user@host:3306/homo_sapiens_core_100_38', 'type': 'other', 'comment': 'test'}
+        other = dict(spec, comment='another test')
+        self.assertNotEqual(ht.handover_key(spec), ht.handover_key(other))
+
+    def test_expired_entries_are_dropped(self):
+        ht._handover_memo['stale'] = ('old_token', 0)
+        key = ht.handover_key({'src_uri': 'mysql://user@host:3306/homo_sapiens_core_100_38', 'comment': 'expiry'})
+        self.assertIsNone(ht.memoize_handover(key, 'token'))
+        self.assertNotIn('stale', ht._handover_memo)
+        ht.forget_handover(key)
+
+
+@mock.patch.object(ht, 'log_and_publish')
+class HandoverChainTest(unittest.TestCase):
+    def bootstrap(self, database):
+        spec = {'src_uri': 'mysql://user@host:3306/%s' % database, 'contact': 'user@ebi.ac.uk',
+                'comment': 'test', 'handover_token': 'token'}
+        with mock.patch.object(ht, 'database_exists', return_value=True), \
+                mock.patch.object(ht, 'get_release', return_value=ht.release), \
+                mock.patch.object(ht, 'get_division', return_value='vertebrates'), \
+                mock.patch.object(ht, 'allowed_divisions_list', ['vertebrates']), \
+                mock.patch.object(ht, 'chain') as chain:
+            ht.bootstrap_handover.run(spec)
+        steps = [sig.task for sig in chain.call_args[0]]
+        link_error = chain.return_value.apply_async.call_args[1]['link_error']
+        return steps, link_error
+
+    def test_chain_includes_metadata_steps(self, log_and_publish):
+        steps, link_error = self.bootstrap('homo_sapiens_core_100_38')
+        self.assertEqual(['ensembl_prodinf.handover_tasks.%s' % name for name in
+                          ('submit_dc', 'process_datachecked_db', 'submit_copy', 'process_copied_db',
+                           'submit_metadata_update', 'process_db_metadata')], steps)
+        self.assertEqual('ensembl_prodinf.handover_tasks.notify_failure', link_error.task)
+
+    def test_grch37_chain_skips_metadata_steps(self, log_and_publish):
+        steps, link_error = self.bootstrap('homo_sapiens_core_100_37')
+        self.assertEqual(['ensembl_prodinf.handover_tasks.%s' % name for name in
+                          ('submit_dc', 'process_datachecked_db', 'submit_copy', 'process_copied_db')], steps)
+        self.assertEqual('ensembl_prodinf.handover_tasks.notify_failure', link_error.task)
+
+    @mock.patch.object(ht, 'send_email')
+    def test_notify_failure_reports_once(self, send_email, log_and_publish):
+        spec = {'src_uri': 'mysql://user@host:3306/homo_sapiens_core_100_38', 'contact': 'user@ebi.ac.uk'}
+        request = mock.Mock(task='ensembl_prodinf.handover_tasks.submit_dc')
+        ht.notify_failure(request, ValueError('cannot submit dc job'), None, spec)
+        log_and_publish.assert_called_once()
+        report = log_and_publish.call_args[0][0]
+        self.assertEqual(('ERROR', 'Handover failed, cannot submit dc job'), (report['report_type'], report['msg']))
+        send_email.assert_called_once()
+
+    def test_handover_database_attaches_errback(self, log_and_publish):
+        spec = {'src_uri': 'mysql://user@host:3306/homo_sapiens_core_100_38', 'contact': 'user@ebi.ac.uk',
+                'comment': 'errback test'}
+        with mock.patch.object(ht.bootstrap_handover, 'apply_async') as apply_async:
+            token = ht.handover_database(spec)
+        ht.forget_handover(ht.handover_key(spec))
+        self.assertEqual(token, spec['handover_token'])
+        self.assertEqual('ensembl_prodinf.handover_tasks.notify_failure',
+                         apply_async.call_args[1]['link_error'].task)
@@ -1,7 +1,9 @@
 import logging
 import unittest
+from smtplib import SMTPServerDisconnected
+from unittest import mock
 
-from ensembl_prodinf.utils import dict_to_perl_string, perl_string_to_python
+from ensembl_prodinf.utils import dict_to_perl_string, perl_string_to_python, SmtpSessionPool
 
 
 logging.basicConfig()
@@ -87,3 +89,24 @@ class UtilsTest(unittest.TestCase):
         o = {'a':None}
         s = dict_to_perl_string(o)
         self.assertEquals(s, """{}""")
+
+
+class SmtpSessionPoolTest(unittest.TestCase):
+
+    @mock.patch('ensembl_prodinf.utils.SMTP')
+    def test_reuses_connection(self, smtp):
+        smtp.return_value.noop.return_value = (250, b'OK')
+        pool = SmtpSessionPool('smtp.example.org')
+        pool.sendmail('from@example.org', ('to@example.org',), 'msg1')
+        pool.sendmail('from@example.org', ('to@example.org',), 'msg2')
+        smtp.assert_called_once_with('smtp.example.org')
+        self.assertEqual(smtp.return_value.sendmail.call_count, 2)
+
+    @mock.patch('ensembl_prodinf.utils.SMTP')
+    def test_reconnects_when_disconnected(self, smtp):
+        smtp.return_value.noop.side_effect = SMTPServerDisconnected()
+        pool = SmtpSessionPool('smtp.example.org')
+        pool.sendmail('from@example.org', ('to@example.org',), 'msg1')
+        pool.sendmail('from@example.org', ('to@example.org',), 'msg2')
+        self.assertEqual(smtp.call_count, 2)
+        self.assertEqual(smtp.return_value.sendmail.call_count, 2)